@@ -32,18 +32,22 @@ SngOptionalHeader = [
     "Rights",
 ]
 
-SngIllegalHeader = [
-    "TitleFormat",
-    "FontSize",
-    "Format",
-    "TitleFormat",
-]
+# frozensets are used for constants which are only used for membership checks
+SngIllegalHeader = frozenset(
+    {
+        "TitleFormat",
+        "FontSize",
+        "Format",
+    }
+)
 
-SngTitleNumberChars = ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "0", "."]
+SngTitleNumberChars = frozenset("0123456789.")
 SngSongBookPrefix = ["EG", "FJ", "WWDLP"]
 
 # All Prefix which are known to be followed by a number
-KnownSongBookPrefix = {"EG", "FJ1", "FJ2", "FJ3", "FJ4", "FJ5", "FJ6", "Wwdlp", "test"}
+KnownSongBookPrefix = frozenset(
+    {"EG", "FJ1", "FJ2", "FJ3", "FJ4", "FJ5", "FJ6", "Wwdlp", "test"}
+)
 
 KnownDirectory = (
     "/home/benste/Documents/Kirchengemeinde Baiersbronn/Beamer/Songbeamer - Songs/"
@@ -69,30 +73,32 @@ KnownSongBookPsalmRange = {
     "WWDLP": {"start": 901, "end": 921},
 }
 
-VerseMarker = [
-    "Unbekannt",
-    "Unbenannt",
-    "Unknown",
-    "Intro",
-    "Vers",
-    "Verse",
-    "Strophe",
-    "Pre - Bridge",
-    "Bridge",
-    "Misc",
-    "Pre-Refrain",
-    "Refrain",
-    "Pre-Chorus",
-    "Chorus",
-    "Pre-Coda",
-    "Zwischenspiel",
-    "Instrumental",
-    "Interlude",
-    "Coda",
-    "Ending",
-    "Outro",
-    "Teil",
-    "Part",
-    "Chor",
-    "Solo",
-]
+VerseMarker = frozenset(
+    {
+        "Unbekannt",
+        "Unbenannt",
+        "Unknown",
+        "Intro",
+        "Vers",
+        "Verse",
+        "Strophe",
+        "Pre - Bridge",
+        "Bridge",
+        "Misc",
+        "Pre-Refrain",
+        "Refrain",
+        "Pre-Chorus",
+        "Chorus",
+        "Pre-Coda",
+        "Zwischenspiel",
+        "Instrumental",
+        "Interlude",
+        "Coda",
+        "Ending",
+        "Outro",
+        "Teil",
+        "Part",
+        "Chor",
+        "Solo",
+    }
+)
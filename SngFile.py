@@ -4,11 +4,15 @@ import json
 import logging
 import logging.config
 import re
-from itertools import chain
+from itertools import chain, islice
 from pathlib import Path
 
 import SNG_DEFAULTS
-from sng_utils import generate_verse_marker_from_line, validate_suspicious_encoding_str
+from sng_utils import (
+    generate_verse_marker_from_line,
+    split_lines_into_slides,
+    validate_suspicious_encoding_str,
+)
 from SngFileHeaderValidationPart import SngFileHeaderValidation
 from SngFileParserPart import SngFileParserPart
 
@@ -18,6 +22,8 @@ with config_file.open(encoding="utf-8") as f_in:
     logging.config.dictConfig(config=logging_config)
 logger = logging.getLogger(__name__)
 
+_NON_DIGIT_RE = re.compile(r"\D+")
+
 
 class SngFile(SngFileParserPart, SngFileHeaderValidation):
     """Main class that defines one single SongBeamer SNG file."""
@@ -43,8 +49,8 @@ class SngFile(SngFileParserPart, SngFileHeaderValidation):
             logger.debug("Added Intro to VerseOrder of (%s)", self.filename)
 
         if "Intro" not in self.content:
-            intro = {"Intro": [["Intro"], []]}
-            self.content = {**intro, **self.content}
+            # dicts keep insertion order - start with Intro and append existing blocks
+            self.content = {"Intro": [["Intro"], []]} | self.content
             self.update_editor_because_content_modified()
             logger.debug("Added Intro Block to (%s)", self.filename)
 
@@ -61,10 +67,12 @@ class SngFile(SngFileParserPart, SngFileHeaderValidation):
         Returns:
             True if something was fixed
         """
+        content_modified = False
         for verse_label, verse_block in self.content.items():  # Iterate all blocks
             # any slide which (except last one) which does not have the correct number of lines is wrong
             has_issues = any(
-                len(slide) != number_of_lines for slide in verse_block[1:-1]
+                len(slide) != number_of_lines
+                for slide in islice(verse_block, 1, len(verse_block) - 1)
             )
             # any last slide which has more lines than desired is wrong
             has_issues |= len(verse_block[-1]) > number_of_lines
@@ -78,19 +86,21 @@ class SngFile(SngFileParserPart, SngFileHeaderValidation):
                 )
 
                 all_lines = list(
-                    chain(*verse_block[1:])
+                    chain.from_iterable(islice(verse_block, 1, None))
                 )  # Merge list of all text lines
 
-                # Remove all old text lines except for Verse Marker
-                self.content[verse_label] = [verse_block[0]]
-                # Append 4 lines per slide as one list - last slide will exceed available lines but simply fill available
-                for i in range(0, len(all_lines), number_of_lines):
-                    self.content[verse_label].append(all_lines[i : i + number_of_lines])
+                # Keep Verse Marker and regroup text lines into slides of number_of_lines
+                self.content[verse_label] = [
+                    verse_block[0],
+                    *split_lines_into_slides(all_lines, number_of_lines),
+                ]
                 has_issues = False
-                self.update_editor_because_content_modified()
+                content_modified = True
             if not has_issues:
                 continue
             return False
+        if content_modified:
+            self.update_editor_because_content_modified()
         return True
 
     def validate_verse_numbers(self, fix: bool = False) -> bool:
@@ -112,7 +122,7 @@ class SngFile(SngFileParserPart, SngFileHeaderValidation):
             if not is_valid_verse_label_list and fix:
                 # fix verse label
                 old_key = " ".join(verse_label_list)
-                new_number = re.sub(r"\D+", "", verse_label_list[1])
+                new_number = _NON_DIGIT_RE.sub("", verse_label_list[1])
                 new_label = [verse_label_list[0], new_number]
                 new_key = " ".join(new_label)
 
@@ -286,13 +296,12 @@ class SngFile(SngFileParserPart, SngFileHeaderValidation):
         # Cleanup Legacy if not used
         if len(new_blocks["Unknown"]) == 1:
             del new_blocks["Unknown"]
-        new_block_keys = list(new_blocks.keys())
+        new_block_keys = list(new_blocks)
 
         # look for position of "Unknown" and replace
-        position_of_unknown = self.header["VerseOrder"].index("Unknown")
-        self.header["VerseOrder"][
-            position_of_unknown : position_of_unknown + 1
-        ] = new_block_keys
+        verse_order = self.header["VerseOrder"]
+        position_of_unknown = verse_order.index("Unknown")
+        verse_order[position_of_unknown : position_of_unknown + 1] = new_block_keys
         logger.info(
             "Added new '%s' in Verse Order of (%s)", new_block_keys, self.filename
         )
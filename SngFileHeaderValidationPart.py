@@ -7,10 +7,18 @@ from pathlib import Path
 
 import SNG_DEFAULTS
 from SNG_DEFAULTS import KnownSongBookPsalmRange, SngIllegalHeader
-from sng_utils import contains_songbook_prefix
+from sng_utils import contains_songbook_prefix, validate_suspicious_encoding_str
 
 logger = logging.getLogger(__name__)
 
+_REQUIRED_HEADERS = frozenset(SNG_DEFAULTS.SngRequiredHeader)
+
+# Songbook Syntax either FJx/yyy, EG YYY, EG YYY.YY or or EG XXX - Psalm X or Wwdlp YYY
+_SONGBOOK_RE = re.compile(
+    r"^(Wwdlp \d{3})$|(^FJ([1-6])\/\d{3})$|"
+    r"^(EG \d{3}(\.\d{1,2})?)( - Psalm \d{1,3}( .{1,3})?)?$"
+)
+
 
 class SngFileHeaderValidation(abc.ABC):
     """Part of SngFile class that defines methods used to validate and fix headers."""
@@ -36,18 +44,18 @@ class SngFileHeaderValidation(abc.ABC):
         Args:
             bool indicating if anything is missing
         """
-        missing = [
-            key for key in SNG_DEFAULTS.SngRequiredHeader if key not in self.header
-        ]
-
-        if self.is_psalm() and "Bible" not in self.header:
+        header = self.header
+        if header.keys() >= _REQUIRED_HEADERS:
+            missing = []
+        else:  # list keeps order of SngRequiredHeader for logging
+            missing = [
+                key for key in SNG_DEFAULTS.SngRequiredHeader if key not in header
+            ]
+
+        if self.is_psalm() and "Bible" not in header:
             missing.append("Bible")
 
-        if (
-            "LangCount" in self.header
-            and int(self.header["LangCount"]) > 1
-            and "Translation" not in self.header
-        ):
+        if self.get_lang_count() > 1 and "Translation" not in header:
             missing.append("Translation")
             # TODO (bensteUEM): Add language validation
             # https://github.com/bensteUEM/SongBeamerQS/issues/33
@@ -61,7 +69,22 @@ class SngFileHeaderValidation(abc.ABC):
 
         return result
 
-    def validate_header_title(self, fix: bool = False) -> bool:  # noqa: C901
+    def get_lang_count(self) -> int:
+        """Helper which reads the LangCount header as number.
+
+        Logs a warning in case LangCount is not a number
+
+        Returns:
+            number of languages - 1 if LangCount is missing or invalid
+        """
+        lang_count = self.header.get("LangCount", "1")
+        try:
+            return int(lang_count)
+        except ValueError:
+            logger.warning("Invalid LangCount=%s in (%s)", lang_count, self.filename)
+            return 1
+
+    def validate_header_title(self, fix: bool = False) -> bool:
         """Validation method for title header.
 
         checks:
@@ -77,33 +100,41 @@ class SngFileHeaderValidation(abc.ABC):
         Returns:
             if Title is valid at end of method
         """
+        error_message = self.get_header_title_error_message()
+
+        if not error_message:
+            return True
+
+        if fix:
+            return self.fix_header_title()
+
+        logger.warning(error_message)
+        return False
+
+    def get_header_title_error_message(self) -> str | None:
+        """Helper which checks the title header without logging or fixing anything.
+
+        Returns:
+            description of the issue with the title or None if title is valid
+        """
         title = self.header.get("Title", "")
         error_message = None
 
         if not title:
-            error_message = f"Song without a Title in Header: {self.filename}"
+            return f"Song without a Title in Header: {self.filename}"
 
-        elif not self.songbook_prefix or self.is_psalm():
+        if not self.songbook_prefix or self.is_psalm():
             # special case - songs without prefix might contain numbers e.g. "Psalm 21.sng" - not the one in EG...
-            return True
+            return None
 
-        contains_number = any(
-            digit.upper() in SNG_DEFAULTS.SngTitleNumberChars for digit in title
-        )
+        contains_number = not SNG_DEFAULTS.SngTitleNumberChars.isdisjoint(title)
         if contains_number:
             error_message = f'Song with Number in Title "{title}" ({self.filename})'
 
         if contains_songbook_prefix(title):
             error_message = f'Song with Songbook in Title "{title}" ({self.filename})'
 
-        if fix and bool(error_message):
-            return self.fix_header_title()
-
-        if bool(error_message):
-            logger.warning(error_message)
-            return False
-        # no fix, but no error
-        return True
+        return error_message
 
     def fix_header_title(self) -> bool:
         """Method which tries to fix title information in header based on filename.
@@ -119,17 +150,28 @@ class SngFileHeaderValidation(abc.ABC):
             )
             logger.warning(error_message)
         else:
-            for part in title_as_list:
-                if all(
-                    digit.upper() in SNG_DEFAULTS.SngTitleNumberChars for digit in part
-                ) or contains_songbook_prefix(part):
-                    title_as_list.remove(part)
-                    self.update_editor_because_content_modified()
-            self.header["Title"] = " ".join(title_as_list)
+            number_chars = SNG_DEFAULTS.SngTitleNumberChars
+            # single parts can only contain a songbook prefix if the whole filename does
+            check_parts_for_prefix = contains_songbook_prefix(self.filename[:-4])
+            title_parts = [
+                part
+                for part in title_as_list
+                if not (
+                    number_chars.issuperset(part)
+                    or (check_parts_for_prefix and contains_songbook_prefix(part))
+                )
+            ]
+            if len(title_parts) != len(title_as_list):
+                self.update_editor_because_content_modified()
+            self.header["Title"] = " ".join(title_parts)
             logger.debug(
                 "Fixed title to (%s) in %s", self.header["Title"], self.filename
             )
-        return self.validate_header_title(fix=False)
+
+        if error_message := self.get_header_title_error_message():
+            logger.warning(error_message)
+            return False
+        return True
 
     def validate_header_songbook(self, fix: bool = False) -> bool:
         """Validation method for Songbook and ChurchSongID headers.
@@ -140,25 +182,43 @@ class SngFileHeaderValidation(abc.ABC):
         Returns:
             if songbook is valid at end of method
         """
-        # Validate Headers
-        if "ChurchSongID" not in self.header or "Songbook" not in self.header:
+        songbook_valid = self.is_header_songbook_valid()
+
+        if fix and not songbook_valid:
+            self.fix_header_church_song_id_caps()
+            self.fix_songbook_from_filename()
+            songbook_valid = self.is_header_songbook_valid()
+
+        if not songbook_valid:
+            logger.error(
+                "Problem occurred with Songbook Fixing of %s - kept original Songbook=%s,ChurchSongID=%s",
+                self.filename,
+                self.header["Songbook"],
+                self.header["ChurchSongID"],
+            )
+            return False
+
+        return True
+
+    def is_header_songbook_valid(self) -> bool:
+        """Helper which checks Songbook and ChurchSongID headers without logging errors or fixing anything.
+
+        Returns:
+            if songbook is valid
+        """
+        church_song_id = self.header.get("ChurchSongID")
+        songbook = self.header.get("Songbook")
+        if church_song_id is None or songbook is None:
             # Hint - ChurchSongID ' '  or '' is automatically removed from SongBeamer on Editing in Songbeamer itself
             songbook_valid = False
         else:
-            songbook_valid = self.header["ChurchSongID"] == self.header["Songbook"]
+            songbook_valid = church_song_id == songbook
 
             # Check that songbook_prefix is part of songbook
-            songbook_valid &= self.songbook_prefix in self.header["Songbook"]
+            songbook_valid &= self.songbook_prefix in songbook
 
             # Check Syntax with Regex, either FJx/yyy, EG YYY, EG YYY.YY or or EG XXX - Psalm X or Wwdlp YYY
-            # ^(Wwdlp \d{3})|(FJ([1-6])\/\d{3})|(EG \d{3}(( - Psalm )\d{1,3})?)$
-            songbook_regex = (
-                r"^(Wwdlp \d{3})$|(^FJ([1-6])\/\d{3})$|"
-                r"^(EG \d{3}(\.\d{1,2})?)( - Psalm \d{1,3}( .{1,3})?)?$"
-            )
-            songbook_valid &= (
-                re.match(songbook_regex, self.header["Songbook"]) is not None
-            )
+            songbook_valid &= _SONGBOOK_RE.match(songbook) is not None
 
             # Check for remaining that "&" should not be present in Songbook
             # songbook_invalid |= self.header["Songbook"].contains('&')
@@ -173,22 +233,7 @@ class SngFileHeaderValidation(abc.ABC):
             # Syntax should be EG xxx - Psalm Y
 
         logger.debug("songbook_valid == %s", songbook_valid)
-
-        if fix and not songbook_valid:
-            self.fix_header_church_song_id_caps()
-            self.fix_songbook_from_filename()
-            songbook_valid = self.validate_header_songbook(fix=False)
-
-        if not songbook_valid:
-            logger.error(
-                "Problem occurred with Songbook Fixing of %s - kept original Songbook=%s,ChurchSongID=%s",
-                self.filename,
-                self.header["Songbook"],
-                self.header["ChurchSongID"],
-            )
-            return False
-
-        return True
+        return songbook_valid
 
     def validate_header_background(self, fix: bool = False) -> bool:
         """Checks that background matches certain criteria.
@@ -256,20 +301,16 @@ class SngFileHeaderValidation(abc.ABC):
             bool if verses_in_order
         """
         if "VerseOrder" in self.header:
-            verse_order_covers_all_blocks = all(
-                i in self.content or "$$M=" + i in self.content or i == "STOP"
-                for i in self.header["VerseOrder"]
-            )
+            verse_order = set(self.header["VerseOrder"])
+            # custom blocks are listed as "$$M=name" in content but as "name" in VerseOrder
+            block_names = {block.removeprefix("$$M=") for block in self.content}
 
-            all_blocks_in_verse_order = all(
-                i[4:] if i[:4] == "$$M=" else i in self.header["VerseOrder"]
-                for i in self.content
+            verse_order_covers_all_blocks = verse_order <= (
+                block_names | self.content.keys() | {"STOP"}
             )
+            all_blocks_in_verse_order = block_names <= verse_order
 
-            if (
-                verses_in_order := all_blocks_in_verse_order
-                & verse_order_covers_all_blocks
-            ):
+            if verse_order_covers_all_blocks and all_blocks_in_verse_order:
                 return True
 
         verses_in_order = False
@@ -281,8 +322,8 @@ class SngFileHeaderValidation(abc.ABC):
         if "VerseOrder" not in self.header:
             logger.debug("Missing VerseOrder in (%s)", self.filename)
         else:
-            logger.debug("\t Not fixed: Order: %s", str(self.header["VerseOrder"]))
-            logger.debug("\t Not fixed: Blocks: %s", list(self.content.keys()))
+            logger.debug("\t Not fixed: Order: %s", self.header["VerseOrder"])
+            logger.debug("\t Not fixed: Blocks: %s", list(self.content))
 
         return verses_in_order
 
@@ -292,28 +333,27 @@ class SngFileHeaderValidation(abc.ABC):
         1. Add all verse labels from blocks that are not yet part of VerseOrder
         2. Delete all verse labels from VerseOrder that do not exist as block
         """
-        self.header["VerseOrder"] = self.header.get("VerseOrder", [])
+        verse_order = self.header.setdefault("VerseOrder", [])
+        verse_order_items = set(verse_order)
 
         # Add blocks to Verse Order if they are missing
         for content_block in self.content:
-            if (
-                content_block[:4] == "$$M="
-                and content_block[4:] not in self.header["VerseOrder"]
-            ):
-                self.header["VerseOrder"].append(content_block[4:])
-            elif content_block not in self.header["VerseOrder"]:
-                self.header["VerseOrder"].append(content_block)
+            block_name = content_block.removeprefix("$$M=")
+            if block_name not in verse_order_items:
+                verse_order.append(block_name)
+                verse_order_items.add(block_name)
 
         # Remove blocks from verse order that don't exist
-        self.header["VerseOrder"][:] = [
-            v
-            for v in self.header["VerseOrder"]
-            if v in self.content or "$$M=" + v in self.content or v == "STOP"
-        ]
+        valid_verse_order_items = (
+            {block.removeprefix("$$M=") for block in self.content}
+            | self.content.keys()
+            | {"STOP"}
+        )
+        verse_order[:] = [v for v in verse_order if v in valid_verse_order_items]
 
         logger.debug(
             "Fixed VerseOrder to %s in (%s)",
-            self.header["VerseOrder"],
+            verse_order,
             self.filename,
         )
         self.update_editor_because_content_modified()
@@ -324,69 +364,21 @@ class SngFileHeaderValidation(abc.ABC):
     ) -> bool:
         """Method which checks that a STOP exists in VerseOrder headers and corrects it.
 
+        Same as validate_header_stop_verseorder
+
         Params:
             should_be_at_end removes any 'STOP' and makes sure only one at end exists
             fix: bool if it should be attempt to fix itself
         Returns:
             if something is wrong after applying method
         """
-        result = True
-        # STOP exists but not at end
-        if (
-            should_be_at_end
-            and "STOP" in self.header["VerseOrder"]
-            and self.header["VerseOrder"][-1] != "STOP"
-        ):
-            if fix:
-                logging.debug("Removing STOP from %s", self.header["VerseOrder"])
-                self.header["VerseOrder"].remove("STOP")
-                self.update_editor_because_content_modified()
-                logging.debug(
-                    "STOP removed at old position in (%s) because not at end",
-                    self.filename,
-                )
-                result = True
-            else:
-                logging.warning(
-                    "STOP from (%s) not at end but not fixed in %s",
-                    self.filename,
-                    self.header["VerseOrder"],
-                )
-                result = False
-
-        # STOP missing overall
-        if "STOP" not in self.header["VerseOrder"]:
-            if fix:
-                self.header["VerseOrder"].append("STOP")
-                logging.debug(
-                    "STOP added at end of VerseOrder of %s: %s",
-                    self.filename,
-                    self.header["VerseOrder"],
-                )
-                self.update_editor_because_content_modified()
-                result = True
-            else:
-                result = False
-                logging.warning(
-                    "STOP missing in (%s) but not fixed in %s",
-                    self.filename,
-                    self.header["VerseOrder"],
-                )
-        return result
+        return self.validate_header_stop_verseorder(
+            fix=fix, should_be_at_end=should_be_at_end
+        )
 
     def fix_header_church_song_id_caps(self) -> bool:
         """Function which replaces any caps of e.g. ChurchSongId to ChurchSongID in header keys."""
-        if "ChurchSongID" not in self.header:
-            for i in self.header:
-                if "ChurchSongID".upper() == i.upper():
-                    self.header["ChurchSongID"] = self.header[i]
-                    del self.header[i]
-                    logger.debug(
-                        "Changed Key from %s to ChurchSongID in %s", i, self.filename
-                    )
-                    self.update_editor_because_content_modified()
-                    return True
-        return False
+        return self.fix_header_key_caps("ChurchSongID")
 
     def fix_header_ccli_caps(self) -> bool:
         """Function which replaces any caps of e.g. ccli Ccli CCLi to CCLI in header keys.
@@ -394,15 +386,36 @@ class SngFileHeaderValidation(abc.ABC):
         Args:
             if updated
         """
-        if "CCLI" not in self.header:
-            for i in self.header:
-                if i.upper() == "CCLI":
-                    self.header["CCLI"] = self.header[i]
-                    del self.header[i]
-                    logger.debug("Changed Key from %s to CCLI in %s", i, self.filename)
-                    self.update_editor_because_content_modified()
-                    return True
-        return False
+        return self.fix_header_key_caps("CCLI")
+
+    def fix_header_key_caps(self, key: str) -> bool:
+        """Function which replaces any caps of a header key by it's expected spelling.
+
+        Args:
+            key: expected spelling of the header key e.g. CCLI
+
+        Returns:
+            if updated
+        """
+        if key in self.header:
+            return False
+
+        key_upper = key.upper()
+        old_key = next(
+            (
+                header_key
+                for header_key in self.header
+                if header_key.upper() == key_upper
+            ),
+            None,
+        )
+        if old_key is None:
+            return False
+
+        self.header[key] = self.header.pop(old_key)
+        logger.debug("Changed Key from %s to %s in %s", old_key, key, self.filename)
+        self.update_editor_because_content_modified()
+        return True
 
     def validate_headers_illegal_removed(self, fix: bool = False) -> bool:
         """Checks if all illegeal headers are removed and optionally fixes it by removing illegal ones.
@@ -412,19 +425,23 @@ class SngFileHeaderValidation(abc.ABC):
         Returns:
             if all illegal headers are removed
         """
-        for key in list(self.header.keys()):
-            if key in SngIllegalHeader:
-                if fix:
-                    self.header.pop(key)
-                    self.update_editor_because_content_modified()
-                    logger.debug(
-                        "Removed %s from (%s) as illegal header", key, self.filename
-                    )
-                else:
-                    logger.debug(
-                        "Not fixing illegal header %s in (%s)", key, self.filename
-                    )
-                    return False
+        # only a few illegal headers are known - look them up instead of checking every header
+        if self.header.keys().isdisjoint(SngIllegalHeader):
+            return True
+
+        illegal_headers = [key for key in self.header if key in SngIllegalHeader]
+        if not fix:
+            logger.debug(
+                "Not fixing illegal header %s in (%s)",
+                illegal_headers[0],
+                self.filename,
+            )
+            return False
+
+        for key in illegal_headers:
+            self.header.pop(key)
+            logger.debug("Removed %s from (%s) as illegal header", key, self.filename)
+        self.update_editor_because_content_modified()
         return True
 
     def fix_songbook_from_filename(self) -> bool:
@@ -438,13 +455,11 @@ class SngFileHeaderValidation(abc.ABC):
         Returns:
             if something was updated
         """
-        first_part_of_symbol = self.filename.split(" ")[0]
+        first_part_of_symbol = self.filename.partition(" ")[0]
         songbook_before_change = self.header.get("Songbook", "NOT SET")
 
         # Filename starts with number
-        if all(
-            digit in SNG_DEFAULTS.SngTitleNumberChars for digit in first_part_of_symbol
-        ):
+        if SNG_DEFAULTS.SngTitleNumberChars.issuperset(first_part_of_symbol):
             return self.fix_song_book_with_numbers(number_string=first_part_of_symbol)
 
         if self.songbook_prefix != "":  # Not empty Prefix
@@ -535,16 +550,13 @@ class SngFileHeaderValidation(abc.ABC):
         Returns:
             if something is wrong after applying method
         """
+        verse_order = self.header["VerseOrder"]
         result = True
         # STOP exists but not at end
-        if (
-            should_be_at_end
-            and "STOP" in self.header["VerseOrder"]
-            and self.header["VerseOrder"][-1] != "STOP"
-        ):
+        if should_be_at_end and "STOP" in verse_order and verse_order[-1] != "STOP":
             if fix:
-                logger.debug("Removing STOP from %s", self.header["VerseOrder"])
-                self.header["VerseOrder"].remove("STOP")
+                logger.debug("Removing STOP from %s", verse_order)
+                verse_order.remove("STOP")
                 self.update_editor_because_content_modified()
                 logger.debug(
                     "STOP removed at old position in (%s) because not at end",
@@ -555,18 +567,18 @@ class SngFileHeaderValidation(abc.ABC):
                 logger.warning(
                     "STOP from (%s) not at end but not fixed in %s",
                     self.filename,
-                    self.header["VerseOrder"],
+                    verse_order,
                 )
                 result = False
 
         # STOP missing overall
-        if "STOP" not in self.header["VerseOrder"]:
+        if "STOP" not in verse_order:
             if fix:
-                self.header["VerseOrder"].append("STOP")
+                verse_order.append("STOP")
                 logger.debug(
                     "STOP added at end of VerseOrder of %s: %s",
                     self.filename,
-                    self.header["VerseOrder"],
+                    verse_order,
                 )
                 self.update_editor_because_content_modified()
                 result = True
@@ -575,7 +587,7 @@ class SngFileHeaderValidation(abc.ABC):
                 logger.warning(
                     "STOP missing in (%s) but not fixed in %s",
                     self.filename,
-                    self.header["VerseOrder"],
+                    verse_order,
                 )
         return result
 
@@ -620,53 +632,42 @@ class SngFileHeaderValidation(abc.ABC):
         Returns:
             if condition applies
         """
-        songbook_prefix = next(
-            (
-                prefix
-                for prefix in KnownSongBookPsalmRange
-                if prefix in self.songbook_prefix
-            ),
-            None,
-        )
-
-        if not songbook_prefix:
-            return False
-
-        return (
-            KnownSongBookPsalmRange[songbook_prefix]["start"]
-            <= float(self.filename.split(" ")[0])
-            <= KnownSongBookPsalmRange[songbook_prefix]["end"]
-        )
+        # is_psalm is called by several validations of the same song
+        # result is kept per instance and recalculated if songbook prefix or filename changed
+        psalm_key = (self.songbook_prefix, self.filename)
+        cached_key, result = getattr(self, "_is_psalm_cache", (None, False))
+        if cached_key != psalm_key:
+            result = _is_psalm(*psalm_key)
+            self._is_psalm_cache = (psalm_key, result)
+        return result
 
 
-def validate_suspicious_encoding_str(text: str, fix: bool = False) -> tuple[bool, str]:
-    """Function that checks a single text str assuming a utf8 encoded file has been accidentaly written as iso8995-1.
+def _is_psalm(songbook_prefix: str, filename: str) -> bool:
+    """Check used by SngFileHeaderValidation.is_psalm.
 
-    and replacing common german 'Umlaut' and sz
+    Args:
+        songbook_prefix: songbook prefix of the song e.g. EG
+        filename: filename of the song e.g. 709 Herr, sei nicht ferne.sng
 
-    Params:
-        text: the str to check and or correct
-        fix: if method should try to fix the encoding issues
     Returns:
-        * bool indicating whether suspicious characters remains
-        * text (repaired if fix was True)
+        if song is a psalm
     """
-    valid = True
-    if re.match("Ã¤|Ã¶|Ã¼|Ã\\x84|Ã\\x96|Ã\\x9c|Ã\\x9f", text):
-        logger.info("Found problematic encoding in str '%s'", text)
-        if fix:
-            orginal_text = text
-            text = re.sub("Ã¤", "ä", text, count=0)
-            text = re.sub("Ã¶", "ö", text, count=0)
-            text = re.sub("Ã¼", "ü", text, count=0)
-            text = re.sub("Ã\x84", "Ä", text, count=0)
-            text = re.sub("Ã\x96", "Ö", text, count=0)
-            text = re.sub("Ã\x9c", "Ü", text, count=0)
-            text = re.sub("Ã\x9f", "ß", text, count=0)
-            if text != orginal_text:
-                logger.debug("replaced %s by %s", orginal_text, text)
-            else:
-                logger.warning("%s - could not be fixed automatically", orginal_text)
-        else:
-            valid = False
-    return valid, text
+    # songbook prefix usually is a key itself - otherwise check for a key which is part of it
+    psalm_range = KnownSongBookPsalmRange.get(songbook_prefix) or next(
+        (
+            psalm_range
+            for prefix, psalm_range in KnownSongBookPsalmRange.items()
+            if prefix in songbook_prefix
+        ),
+        None,
+    )
+
+    if not psalm_range:
+        return False
+
+    # e.g. 909.1 is a part of psalm number 909 - anything not numeric can't be a psalm
+    number, _, sub_number = filename.partition(" ")[0].partition(".")
+    if not number.isdecimal() or (sub_number and not sub_number.isdecimal()):
+        return False
+
+    return psalm_range["start"] <= int(number) <= psalm_range["end"]
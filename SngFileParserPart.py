@@ -2,13 +2,30 @@
 
 import abc
 import logging
-from io import TextIOWrapper
+import os
+from collections.abc import Iterable
+from io import StringIO, TextIOBase
 from pathlib import Path
 
-from SNG_DEFAULTS import SngDefaultHeader
+from SNG_DEFAULTS import SngDefaultHeader, VerseMarker
 
 logger = logging.getLogger(__name__)
 
+# decode files in larger chunks than the TextIOWrapper default of 8 KiB
+_READ_CHUNK_SIZE = 65536
+
+
+def _set_read_chunk_size(file_object: TextIOBase) -> None:
+    """Helper which sets the decoding chunk size of an opened text file.
+
+    _CHUNK_SIZE is a private attribute of TextIOWrapper - other file objects are kept unchanged
+
+    Args:
+        file_object: text file opened for reading
+    """
+    if hasattr(file_object, "_CHUNK_SIZE"):
+        file_object._CHUNK_SIZE = _READ_CHUNK_SIZE  # noqa: SLF001
+
 
 class SngFileParserPart(abc.ABC):
     """Part of SngFile class that defines methods used to parse and write sng files."""
@@ -40,41 +57,45 @@ class SngFileParserPart(abc.ABC):
 
         try:
             with Path(filename).open(encoding="utf-8") as file_object:
-                content = file_object.read()
-            if content[0] == "\ufeff":
-                logger.debug("%s is detected as utf-8 because of BOM", filename)
-                content = content[1:]
-            else:
-                logger.info("%s is read as utf-8 but no BOM", filename)
+                _set_read_chunk_size(file_object)
+                if file_object.read(1) == "\ufeff":
+                    logger.debug("%s is detected as utf-8 because of BOM", filename)
+                else:
+                    file_object.seek(0)
+                    logger.info("%s is read as utf-8 but no BOM", filename)
+                self.parse_file_content(file_object)
         except UnicodeDecodeError:
+            # lines are parsed while reading - drop anything parsed before the error
+            self.header = {}
+            self.content = {}
             with Path(filename).open(encoding="iso-8859-1") as file_object:
-                content = file_object.read()
-            logger.info(
-                "%s is read as iso-8859-1 - be aware that encoding is change upon write!",
-                filename,
-            )
-        self.parse_file_content(content)
-
-    def parse_file_content(self, all_lines: list[str]) -> None:
+                _set_read_chunk_size(file_object)
+                logger.info(
+                    "%s is read as iso-8859-1 - be aware that encoding is change upon write!",
+                    filename,
+                )
+                self.parse_file_content(file_object)
+
+    def parse_file_content(self, all_lines: Iterable[str]) -> None:
         """Parse sng file content on a line by lane base.
 
         Args:
-            all_lines: list of lines from sng file
+            all_lines: lines from sng file e.g. an opened file object
         """
         song_blocks = []
-        for line in all_lines.splitlines():
-            line_no_space = line.lstrip()
-            if len(line_no_space) > 0:
-                if (
-                    line_no_space[0] == "#" and line_no_space[1] != "#"
-                ):  # Tech Param for Header
-                    self.parse_param(line_no_space)
-                elif (
-                    line_no_space == "---"
-                ):  # For each new Slide within a block add new list and increase index
-                    song_blocks.append([])
-                else:  # lyrics line
-                    song_blocks[-1].append(line_no_space)
+        for line in all_lines:
+            line_no_space = line.rstrip("\n").lstrip()
+            if not line_no_space:
+                continue
+            first_char = line_no_space[0]
+            if first_char == "#" and line_no_space[1:2] != "#":  # Tech Param for Header
+                self.parse_param(line_no_space)
+            elif (
+                first_char == "-" and line_no_space == "---"
+            ):  # For each new Slide within a block add new list and increase index
+                song_blocks.append([])
+            else:  # lyrics line
+                song_blocks[-1].append(line_no_space)
         logger.debug("Parsing content for: %s", self.filename)
         self.parse_content(song_blocks)
 
@@ -94,10 +115,10 @@ class SngFileParserPart(abc.ABC):
             if len(content) == 0:  # Skip in case there is no content
                 self.update_editor_because_content_modified()
                 continue
-            if get_verse_marker_line(content[0]) is not None:  # New named content
+            verse_marker = get_verse_marker_line(content[0])
+            if verse_marker is not None:  # New named content
                 current_contentname = content[0]
-                self.content[current_contentname] = [get_verse_marker_line(content[0])]
-                self.content[current_contentname].append(content[1:])
+                self.content[current_contentname] = [verse_marker, content[1:]]
             elif current_contentname is None:  # New unnamed content
                 self.update_editor_because_content_modified()
                 current_contentname = "Unknown"
@@ -116,11 +137,11 @@ class SngFileParserPart(abc.ABC):
         Args:
             line: string of one line from a SNG file
         """
-        if line.__contains__("="):
-            line_split = line.split("=", 1)
-            key = line_split[0][1:]
-            value = line_split[1].split(",") if key == "VerseOrder" else line_split[1]
-            self.header[key] = value
+        key_part, separator, value = line.partition("=")
+        if not separator:
+            return
+        key = key_part[1:]
+        self.header[key] = value.split(",") if key == "VerseOrder" else value
 
     def update_editor_because_content_modified(self) -> None:
         """Method used to update editor to mark files that are updated compared to it's original."""
@@ -155,28 +176,37 @@ class SngFileParserPart(abc.ABC):
             encoding: name of the encoding usually utf-8 alternatively iso-8859-1 for older files
         """
         filename = Path(str(self.path) + "/" + self.filename[:-4] + suffix + ".sng")
-        with Path(filename).open(encoding=encoding, mode="w") as new_file:
-            # 1. Encoding indicator
-            if encoding == "utf-8":
-                new_file.write(
-                    "\ufeff"
-                )  # BOM to indicate UTF-8 encoding for legacy compatibility
-            self.write_file_headers(new_file)
-            self.write_file_content(new_file)
-
-    def write_file_headers(self, output_file: TextIOWrapper) -> None:
+        # Assemble the whole file in memory in order to write it with a single call
+        output = StringIO()
+        # 1. Encoding indicator
+        if encoding == "utf-8":
+            output.write(
+                "\ufeff"
+            )  # BOM to indicate UTF-8 encoding for legacy compatibility
+        self.write_file_headers(output)
+        self.write_file_content(output)
+
+        # encode before opening - an encoding error must not truncate an existing file
+        text = output.getvalue()
+        if os.linesep != "\n":
+            text = text.replace("\n", os.linesep)
+        Path(filename).write_bytes(text.encode(encoding))
+
+    def write_file_headers(self, output_file: TextIOBase) -> None:
         """Write headers of sng file to already opened file.
 
         Args:
             output_file: the file object to write into
         """
+        header_lines = []
         for key, value in self.header.items():
             if key == "VerseOrder":
-                output_file.write("#" + key + "=" + ",".join(value) + "\n")
+                header_lines.append(f"#{key}={','.join(value)}\n")
             else:
-                output_file.write("#" + key + "=" + value + "\n")
+                header_lines.append(f"#{key}={value}\n")
+        output_file.write("".join(header_lines))
 
-    def write_file_content(self, output_file: TextIOWrapper) -> None:
+    def write_file_content(self, output_file: TextIOBase) -> None:
         """Write content of sng file to already opened file.
 
         * blocks with verse markers
@@ -185,16 +215,20 @@ class SngFileParserPart(abc.ABC):
         Args:
             output_file: the file object to write into
         """
+        content_lines = []
         for key, verse_block in self.content.items():
-            result = ["---", key]
+            content_lines.extend(("---", key))
             is_new_verse_block = True
             for slide in verse_block[1:]:
                 if not is_new_verse_block:
-                    result.append("---")
+                    content_lines.append("---")
                 if len(slide) != 0:
-                    result.extend(slide)
+                    content_lines.extend(slide)
                     is_new_verse_block = False
-            output_file.writelines(f"{line}\n" for line in result)
+
+        # empty last item adds the final line break - nothing is written without content
+        content_lines.append("")
+        output_file.write("\n".join(content_lines))
 
 
 def get_verse_marker_line(line: str) -> list:
@@ -206,19 +240,13 @@ def get_verse_marker_line(line: str) -> list:
     Returns:
         True in case matches, otherwise False
     """
-    from SNG_DEFAULTS import VerseMarker
-
     if line.startswith("$$M="):
         return ["$$M=", line[4:]]
 
-    line = line.split(" ")
+    marker, separator, number = line.partition(" ")
 
     # Case with implicit line label which is not verse label yet
-    number_of_blocks_if_verse_marker = 2
-    if len(line) > number_of_blocks_if_verse_marker:
+    if marker not in VerseMarker or " " in number:
         return None
 
-    if line[0] in VerseMarker:
-        return line
-
-    return None
+    return [marker, number] if separator else [marker]
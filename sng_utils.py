@@ -14,6 +14,37 @@ with config_file.open(encoding="utf-8") as f_in:
     logging.config.dictConfig(config=logging_config)
 logger = logging.getLogger(__name__)
 
+# any songbook prefix which is neither preceded nor followed by other letters - e.g. EG 001, 999/FJ5 but not Egal
+# [^\W\d] matches letters and _ - lookarounds don't consume the separator and also apply at the start and end of text
+_SONGBOOK_PREFIX_RE = re.compile(
+    r"(?<![^\W\d])(?:"
+    + "|".join(map(re.escape, SNG_DEFAULTS.SngSongBookPrefix))
+    + r")(?![^\W\d])"
+)
+
+# optional verse label and number at the beginning of a line e.g. "Refrain 1:", "V3" or "4."
+_CHORUS_PREFIX = r"(?:(?:R(?:efrain)?)|(?:C(?:horus)?)) ?"
+_VERSE_PREFIX = r"(?:(?:V(?:erse)?)|(?:S(?:trophe)?)) ?"
+_BRIDGE_PREFIX = r"(?:(?:B(?:ridge)?)) ?"
+_VERSE_MARKER_RE = re.compile(
+    rf"({_CHORUS_PREFIX}|{_VERSE_PREFIX}|{_BRIDGE_PREFIX})?(\d*)(?:[:.]?)?",
+    flags=re.IGNORECASE,
+)
+
+# utf-8 encoded german 'Umlaut' and sz which have been read as iso-8859-1
+_SUSPICIOUS_ENCODING_FIXES = {
+    "Ã¤": "ä",
+    "Ã¶": "ö",
+    "Ã¼": "ü",
+    "Ã\x84": "Ä",
+    "Ã\x96": "Ö",
+    "Ã\x9c": "Ü",
+    "Ã\x9f": "ß",
+}
+_SUSPICIOUS_ENCODING_RE = re.compile(
+    "|".join(map(re.escape, _SUSPICIOUS_ENCODING_FIXES))
+)
+
 
 def contains_songbook_prefix(text: str) -> bool:
     """Helper function to determine whether text contains a songbook prefix.
@@ -23,12 +54,12 @@ def contains_songbook_prefix(text: str) -> bool:
     Returns:
         result of check
     """
-    result = False
+    text = text.upper()
+    # plain substring check first - regex is only required to check the characters around a prefix
     for prefix in SNG_DEFAULTS.SngSongBookPrefix:
-        songbook_regex = rf"({prefix}\W+.*)|(.*\W+{prefix})|({prefix}\d+.*)|(.*\d+{prefix})|(^{prefix})|({prefix}$)"
-        result |= re.match(songbook_regex, text.upper()) is not None
-
-    return result
+        if prefix in text:
+            return _SONGBOOK_PREFIX_RE.search(text) is not None
+    return False
 
 
 def generate_verse_marker_from_line(line: str) -> tuple[list[str, str] | None, str]:
@@ -44,38 +75,42 @@ def generate_verse_marker_from_line(line: str) -> tuple[list[str, str] | None, s
         1. parsed versemarker (None if not detected) e.g. ["Chorus", 1] or ["Bridge",""]]
         2. remaining text
     """
-    chorus_prefix = r"(?:(?:R(?:efrain)?)|(?:C(?:horus)?)) ?"
-    verse_prefix = r"(?:(?:V(?:erse)?)|(?:S(?:trophe)?)) ?"
-    bridge_prefix = r"(?:(?:B(?:ridge)?)) ?"
-    combined_prefix = f"{chorus_prefix}|{verse_prefix}|{bridge_prefix}"
-
-    match_groups = re.split(
-        rf"^({combined_prefix})?(\d*)(?:[:.]?)?", line, flags=re.IGNORECASE
-    )
+    verse_marker_match = _VERSE_MARKER_RE.match(line)
+    prefix, number = verse_marker_match.groups()
+    text = line[verse_marker_match.end() :]
+
+    # prefix patterns only differ in their first letter - same case sensitive check as matching the patterns
     verse_marker = None
-    text = line
-    match_number = match_groups[2]
-    number = match_number if match_number else ""
-
-    if (
-        (match_groups[1] is None and bool(match_groups[2]))
-        or match_groups[1] is not None
-        or (match_groups[1] is None and not number)
-    ):
-        text = match_groups[3]
-
-        if (match_groups[1] is None and match_groups[2]) or re.match(
-            verse_prefix, str(match_groups[1])
-        ):
-            verse_marker = ["Verse", number]
-        elif re.match(chorus_prefix, str(match_groups[1])):
-            verse_marker = ["Chorus", number]
-        elif re.match(bridge_prefix, str(match_groups[1])):
-            verse_marker = ["Bridge", number]
+    if (prefix is None and number) or (prefix is not None and prefix[0] in "VS"):
+        verse_marker = ["Verse", number]
+    elif prefix is not None and prefix[0] in "RC":
+        verse_marker = ["Chorus", number]
+    elif prefix is not None and prefix[0] == "B":
+        verse_marker = ["Bridge", number]
 
     return verse_marker, text.lstrip()
 
 
+def split_lines_into_slides(
+    all_lines: list[str], number_of_lines: int = 4
+) -> list[list[str]]:
+    """Helper which regroups a flat list of text lines into slides of a fixed size.
+
+    The last slide contains the remaining lines and can therefore be shorter
+
+    Args:
+        all_lines: text lines of all slides of one verse block
+        number_of_lines: max number of lines per slide
+
+    Returns:
+        list of slides each being a list of text lines
+    """
+    return [
+        all_lines[i : i + number_of_lines]
+        for i in range(0, len(all_lines), number_of_lines)
+    ]
+
+
 def validate_suspicious_encoding_str(text: str, fix: bool = False) -> tuple[bool, str]:
     """Function that checks a single text str assuming a utf8 encoded file has been accidentaly written as iso8995-1.
 
@@ -89,17 +124,13 @@ def validate_suspicious_encoding_str(text: str, fix: bool = False) -> tuple[bool
         * text (repaired if fix was True)
     """
     valid = True
-    if re.match("Ã¤|Ã¶|Ã¼|Ã\\x84|Ã\\x96|Ã\\x9c|Ã\\x9f", text):
+    if _SUSPICIOUS_ENCODING_RE.search(text):
         logger.info("Found problematic encoding in str '%s'", text)
         if fix:
             orginal_text = text
-            text = re.sub("Ã¤", "ä", text, count=0)
-            text = re.sub("Ã¶", "ö", text, count=0)
-            text = re.sub("Ã¼", "ü", text, count=0)
-            text = re.sub("Ã\x84", "Ä", text, count=0)
-            text = re.sub("Ã\x96", "Ö", text, count=0)
-            text = re.sub("Ã\x9c", "Ü", text, count=0)
-            text = re.sub("Ã\x9f", "ß", text, count=0)
+            text = _SUSPICIOUS_ENCODING_RE.sub(
+                lambda match: _SUSPICIOUS_ENCODING_FIXES[match.group()], text
+            )
             if text != orginal_text:
                 logger.debug("replaced %s by %s", orginal_text, text)
             else:
@@ -52,10 +52,12 @@ class TestSNG(unittest.TestCase):
         """
         super().__init__(*args, **kwargs)
 
-    def setUp(self) -> None:
+    @classmethod
+    def setUpClass(cls) -> None:
         """Setup of TestCase.
 
         Prepares anything that can be used by all tests
+        API login is done once for the whole class instead of once per test
         """
         ct_domain = os.getenv("CT_DOMAIN")
         ct_token = os.getenv("CT_TOKEN")
@@ -71,7 +73,7 @@ class TestSNG(unittest.TestCase):
             ct_domain = config.ct_domain
             ct_token = config.ct_token
 
-        self.api = ChurchToolsApi(domain=ct_domain, ct_token=ct_token)
+        cls.api = ChurchToolsApi(domain=ct_domain, ct_token=ct_token)
 
     def test_ct_connection_established(self) -> None:
         """Checks that an API connection to a CT instance was establied.
@@ -136,7 +138,8 @@ class TestSNG(unittest.TestCase):
             number_of_files_with_eg_songbook_pre_fix,
         )
 
-        songs_df["SngFile"].apply(lambda x: x.validate_header_songbook(True))
+        for song in songs_df["SngFile"]:
+            song.validate_header_songbook(True)
 
         generate_songbook_column(eg_songs_df)
 
@@ -174,10 +177,10 @@ class TestSNG(unittest.TestCase):
         self.assertEqual(
             "WWDLP 999 and EG 999", song_df["SngFile"].iloc[0].header["Songbook"]
         )
-        result = song_df["SngFile"].apply(lambda x: x.validate_header_songbook(False))
-        self.assertEqual(result.sum(), 0, "Should have no valid entries")
-        result = song_df["SngFile"].apply(lambda x: x.validate_header_songbook(True))
-        self.assertEqual(result.sum(), 1, "Should have one valid entry")
+        result = [song.validate_header_songbook(False) for song in song_df["SngFile"]]
+        self.assertEqual(sum(result), 0, "Should have no valid entries")
+        result = [song.validate_header_songbook(True) for song in song_df["SngFile"]]
+        self.assertEqual(sum(result), 1, "Should have one valid entry")
         result = generate_songbook_column(song_df)
         self.assertEqual("EG 001", song_df["SngFile"].iloc[0].header["Songbook"])
         self.assertEqual(
@@ -195,8 +198,8 @@ class TestSNG(unittest.TestCase):
         self.assertEqual(
             "EG 709 - Psalm 22 I", song_df["SngFile"].iloc[0].header["Songbook"]
         )
-        result = song_df["SngFile"].apply(lambda x: x.validate_header_songbook(False))
-        self.assertEqual(result.sum(), 1, "Should have one valid entry")
+        result = [song.validate_header_songbook(False) for song in song_df["SngFile"]]
+        self.assertEqual(sum(result), 1, "Should have one valid entry")
 
     def test_validate_comment_special_case(self) -> None:
         """Test method which validates one specific file which had differences while parsing."""
@@ -53,6 +53,14 @@ class TestSNGHeaderValidation(unittest.TestCase):
             test_data_dir / sample_filename
         )
 
+    def test_header_title_fix_consecutive_parts(self) -> None:
+        """Checks that consecutive number and songbook parts of the filename are all removed from the title."""
+        song = SngFile("testData/Test/sample_missing_headers.sng", "Test")
+        song.filename = "001 EG Sample Title.sng"
+
+        self.assertTrue(song.validate_header_title(fix=True))
+        self.assertEqual("Sample Title", song.header["Title"])
+
     def test_header_title_valid_no_change(self) -> None:
         """Checks that header title is not fixed for sample file which is psalm with valid title."""
         test_data_dir = Path("testData/EG Psalmen & Sonstiges")
@@ -125,6 +133,13 @@ class TestSNGHeaderValidation(unittest.TestCase):
         )
         self.assertTrue(test_song.is_psalm())
 
+        # result must follow changes of filename or songbook prefix
+        test_song.filename = "001 Herr, sei nicht ferne.sng"
+        self.assertFalse(test_song.is_psalm())
+        test_song.filename = "709 Herr, sei nicht ferne.sng"
+        test_song.songbook_prefix = ""
+        self.assertFalse(test_song.is_psalm())
+
         test_song = SngFile(
             "./testData/EG Lieder/001 Macht Hoch die Tuer.sng",
             songbook_prefix="EG",
@@ -137,6 +152,17 @@ class TestSNGHeaderValidation(unittest.TestCase):
         )
         self.assertFalse(test_song.is_psalm())
 
+        test_song = SngFile(
+            "./testData/Test/sample_no_ct.sng",
+            songbook_prefix="EG",
+        )
+        self.assertFalse(test_song.is_psalm())
+
+        # filename is not a valid song number - must not raise while checking for psalm
+        test_song.filename = ".5 Psalm.sng"
+        self.assertFalse(test_song.is_psalm())
+        test_song.fix_songbook_from_filename()
+
     def test_header_all(self) -> None:
         """Checks if all params of the test file are correctly parsed.
 
@@ -237,6 +263,33 @@ class TestSNGHeaderValidation(unittest.TestCase):
             ],
         )
 
+    def test_validate_headers_lang_count(self) -> None:
+        """Checks that LangCount is read like int() and invalid values are logged."""
+        test_dir = Path("./testData/Test")
+        test_file_name = "sample.sng"
+        song = SngFile(test_dir / test_file_name)
+        song.header.pop("Translation", None)
+
+        song.header["LangCount"] = "2 "
+        with self.assertLogs(level="WARNING") as cm:
+            self.assertFalse(song.validate_headers())
+        self.assertEqual(
+            cm.output,
+            [
+                f"WARNING:SngFileHeaderValidationPart:Missing required headers in ({test_file_name}) ['Translation']"
+            ],
+        )
+
+        song.header["LangCount"] = "two"
+        with self.assertLogs(level="WARNING") as cm:
+            self.assertTrue(song.validate_headers())
+        self.assertEqual(
+            cm.output,
+            [
+                f"WARNING:SngFileHeaderValidationPart:Invalid LangCount=two in ({test_file_name})"
+            ],
+        )
+
     def test_header_illegal_removed(self) -> None:
         """Tests that all illegal headers are removed."""
         song = SngFile(
@@ -339,6 +392,19 @@ class TestSNGHeaderValidation(unittest.TestCase):
         self.assertNotIn("ChurchSongId", song.header.keys())
         self.assertEqual(song.header["ChurchSongID"], "EG 000")
 
+    def test_header_ccli_caps(self) -> None:
+        """Test that checks for incorrect capitalization in CCLI and it's autocorrect."""
+        test_dir = Path("./testData/Test")
+        test_filename = "sample.sng"
+        song = SngFile(test_dir / test_filename)
+        song.header["Ccli"] = song.header.pop("CCLI", "12345")
+        ccli = song.header["Ccli"]
+
+        self.assertTrue(song.fix_header_ccli_caps())
+        self.assertNotIn("Ccli", song.header)
+        self.assertEqual(ccli, song.header["CCLI"])
+        self.assertFalse(song.fix_header_ccli_caps())
+
     def test_validate_header_background(self) -> None:
         """Test case for background images both with and without fix.
 
@@ -521,6 +587,14 @@ class TestSNGHeaderValidation(unittest.TestCase):
 
         self.assertEqual(song.header["VerseOrder"], expected_verse_order)
 
+    def test_header_verse_order_custom_block_missing(self) -> None:
+        """Checks that a custom $$M= block which is not part of VerseOrder is detected."""
+        song = SngFile("./testData/Herzlich Willkommen.sng", "EG")
+        self.assertTrue(song.validate_verse_order_coverage())
+
+        song.header["VerseOrder"].remove("Variante 1")
+        self.assertFalse(song.validate_verse_order_coverage())
+
     def test_header_verse_order_special3(self) -> None:
         """Special Case welcome slide with custom verse headers."""
         song = SngFile("./testData/Herzlich Willkommen.sng", "EG")
@@ -533,6 +607,11 @@ class TestSNGHeaderValidation(unittest.TestCase):
             ["Intro", "Variante 1", "Variante 2", "Intro", "STOP"],
             song.header["VerseOrder"],
         )
+        song.fix_verse_order_coverage()
+        self.assertEqual(
+            ["Intro", "Variante 1", "Variante 2", "Intro", "STOP"],
+            song.header["VerseOrder"],
+        )
 
     def test_header_validate_verse_numbers_merge(self) -> None:
         """Special case check 1b is 2nd part of verse 1."""
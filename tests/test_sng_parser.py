@@ -76,6 +76,16 @@ class TestSNGParser(unittest.TestCase):
         song2 = SngFile("./testData/Test/sample_missing_headers.sng")
         self.assertNotIn("Title", song2.header)
 
+    def test_parse_file_content_short_header_line(self) -> None:
+        """Checks that a header line consisting of a single "#" is ignored instead of failing."""
+        song = SngFile("./testData/Test/sample_header_only.sng")
+        song.header = {}
+        song.content = {}
+        song.parse_file_content(["#", "#Title=Short", "---", "Verse 1", "Text"])
+
+        self.assertEqual({"Title": "Short"}, song.header)
+        self.assertEqual({"Verse 1": [["Verse", "1"], ["Text"]]}, song.content)
+
     def test_file_write(self) -> None:
         """Functions which compares the original file to the one generated after parsing."""
         test_dir = Path("./testData/Test")
@@ -93,6 +103,23 @@ class TestSNGParser(unittest.TestCase):
 
         (test_dir / (test_filename[:-4] + "_test_file_write.sng")).unlink()
 
+    def test_file_write_encoding_error(self) -> None:
+        """Checks that an existing file is kept if the content can't be written with the requested encoding."""
+        test_dir = Path("./testData/Test")
+        test_filename = "sample.sng"
+        test_write_path = test_dir / (test_filename[:-4] + "_test_file_write.sng")
+
+        song = SngFile(test_dir / test_filename, "EG")
+        song.header["Bible"] = "Psalm 85, 2\u20138"
+        song.write_file(suffix="_test_file_write")
+        expected = test_write_path.read_bytes()
+
+        with self.assertRaises(UnicodeEncodeError):
+            song.write_file(suffix="_test_file_write", encoding="iso-8859-1")
+        self.assertEqual(expected, test_write_path.read_bytes())
+
+        test_write_path.unlink()
+
     def test_file_short(self) -> None:
         """Checks a specific SNG file which contains a header only and no content."""
         test_dir = Path("./testData/Test/")
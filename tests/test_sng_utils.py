@@ -6,7 +6,12 @@ import logging.config
 import unittest
 from pathlib import Path
 
-from sng_utils import contains_songbook_prefix, generate_verse_marker_from_line
+from sng_utils import (
+    contains_songbook_prefix,
+    generate_verse_marker_from_line,
+    split_lines_into_slides,
+    validate_suspicious_encoding_str,
+)
 
 config_file = Path("logging_config.json")
 with config_file.open(encoding="utf-8") as f_in:
@@ -31,6 +36,8 @@ class TestSNGUtils(unittest.TestCase):
         """Test that runs various variations of songbook parts which should be detected by improved helper method."""
         # negative samples
         self.assertFalse(contains_songbook_prefix("gesegnet"))
+        self.assertFalse(contains_songbook_prefix("Egal"))
+        self.assertFalse(contains_songbook_prefix("Fjord 3"))
         logger.debug("finished negative samples")
 
         # positive samples
@@ -93,6 +100,24 @@ class TestSNGUtils(unittest.TestCase):
 
         logger.debug("finished test_generate_verse_marker_from_line")
 
+    def test_split_lines_into_slides(self) -> None:
+        """Test that text lines are regrouped into slides with a max number of lines."""
+        lines = [str(i) for i in range(10)]
+        expected = [["0", "1", "2", "3"], ["4", "5", "6", "7"], ["8", "9"]]
+        self.assertEqual(expected, split_lines_into_slides(lines, 4))
+        self.assertEqual([], split_lines_into_slides([], 4))
+
+    def test_validate_suspicious_encoding_str(self) -> None:
+        """Test that wrongly encoded characters are detected and fixed anywhere within a text."""
+        self.assertEqual((True, "Mädchen"), validate_suspicious_encoding_str("Mädchen"))
+        self.assertEqual(
+            (False, "MÃ¤dchen"), validate_suspicious_encoding_str("MÃ¤dchen")
+        )
+        self.assertEqual(
+            (True, "Mädchen Größe"),
+            validate_suspicious_encoding_str("MÃ¤dchen GrÃ¶Ã\x9fe", fix=True),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()